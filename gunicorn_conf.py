@@ -0,0 +1,19 @@
+"""
+Gunicorn configuration for the Mannheim DS Planner container.
+
+The app is stateless, so requests scale across worker processes. The app is
+preloaded in the master, which builds the catalog data and the cached
+(pre-compressed) catalog response at import; forked workers share them
+copy-on-write.
+"""
+
+import os
+
+# Fixed to match EXPOSE and HEALTHCHECK in the Dockerfile
+bind = "0.0.0.0:8080"
+# Conservative default: the CPU count seen in a container is the host's,
+# not the container's quota. Scale up with WEB_CONCURRENCY.
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+preload_app = True
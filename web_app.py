@@ -7,16 +7,23 @@ The server only provides read-only catalog data.
 """
 
 from __future__ import annotations
-from typing import Union, List, Dict, Any, Optional
+from typing import Union, List, Dict, Any, Optional, Tuple, Callable
 from flask import Flask, jsonify, request, render_template, Response
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
-import json
-import re
+from functools import lru_cache
+from operator import itemgetter
+from flask_orjson import OrjsonProvider
+import brotli
+import orjson
+import gzip
+import hashlib
+import mmap
 import os
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # =============================================================================
 # DATA LOADING (Read-only catalog)
@@ -24,13 +31,33 @@ app = Flask(__name__)
 
 DATA_DIR = Path(__file__).parent / "data"
 
+# Data files at least this large are memory-mapped instead of read into memory
+MMAP_MIN_BYTES = 256 * 1024
+
+# Catalog source files whose mtimes decide whether the cached response is stale
+CATALOG_SOURCE_FILES = ("courses_full.json", "courses_parsed.json", "restricted_courses.json")
+
+# Serialized /api/catalog response: (source mtimes, bodies by content coding, etag)
+_CATALOG_CACHE: Optional[Tuple[Tuple[float, ...], Dict[str, bytes], str]] = None
+
+# Serialized courses: (source mtimes, courses in file order, lookup by ID/code alias)
+_SERIALIZED_CACHE: Optional[Tuple[Tuple[float, ...], List[Dict], Dict[str, Dict]]] = None
+
 
 def _load_json(filename: str) -> Union[Dict, List]:
-    """Load a JSON file from the data directory."""
+    """Load a JSON file from the data directory.
+    
+    Large files are memory-mapped and parsed in place to avoid copying them
+    into a bytes object first.
+    """
     path = DATA_DIR / filename
     if not path.exists():
         return {}
-    return json.loads(path.read_text(encoding="utf-8"))
+    if path.stat().st_size < MMAP_MIN_BYTES:
+        return orjson.loads(path.read_bytes())
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
 
 
 def _load_courses() -> List[Dict]:
@@ -55,6 +82,41 @@ def _load_restricted() -> Dict:
     return _load_json("restricted_courses.json")
 
 
+def _build_restricted_map() -> Dict[str, Dict]:
+    """Map upper-cased course code -> restriction entry."""
+    return {
+        (item.get("code") or "").upper(): item
+        for item in _load_restricted().get("restricted", [])
+        if item.get("code")
+    }
+
+
+def _catalog_mtimes() -> Tuple[float, ...]:
+    """Return the mtimes of the catalog source files (0.0 for missing files)."""
+    mtimes = []
+    for filename in CATALOG_SOURCE_FILES:
+        try:
+            mtimes.append((DATA_DIR / filename).stat().st_mtime)
+        except OSError:
+            mtimes.append(0.0)
+    return tuple(mtimes)
+
+
+def _refresh_catalog_data() -> Tuple[float, ...]:
+    """Reload the preloaded catalog data if a source file changed.
+    
+    Returns the source mtimes the loaded data corresponds to.
+    """
+    global _COURSES_RAW, _RESTRICTED_MAP, _DATA_MTIMES, _resolve_assigned_area
+    mtimes = _catalog_mtimes()
+    if mtimes != _DATA_MTIMES:
+        _COURSES_RAW = _load_courses()
+        _RESTRICTED_MAP = _build_restricted_map()
+        _resolve_assigned_area = _select_area_resolver(_COURSES_RAW)
+        _DATA_MTIMES = mtimes
+    return mtimes
+
+
 # MMDS Program Rules (PO 2024)
 MMDS_RULES = {
     "program_name": "M.Sc. Data Science (Mannheim)",
@@ -69,6 +131,9 @@ MMDS_RULES = {
     ]
 }
 
+# Area ID -> display name
+_AREA_NAME_BY_ID = {area["id"]: area["name"] for area in MMDS_RULES["areas"]}
+
 # Additional Course module constants
 ADDITIONAL_COURSE_CODES = {"AC 651", "AC 652", "AC 653", "AC 654"}
 ADDITIONAL_COURSE_MAX_ECTS = 18
@@ -84,14 +149,30 @@ AREA_COLORS = {
     "unassigned": "#d2c8bf",
 }
 
+# Static catalog metadata, serialized once and spliced into the catalog body
+_RULES_JSON = orjson.dumps(MMDS_RULES)
+_AREA_COLORS_JSON = orjson.dumps(AREA_COLORS)
+
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+# ASCII bytes dropped by _normalize_text (everything except a-z and 0-9)
+_NORM_DELETE = bytes(b for b in range(128) if not (chr(b).isdigit() or "a" <= chr(b) <= "z"))
+
+
 def _normalize_text(text: str) -> str:
-    """Normalize text for matching."""
-    return re.sub(r"[^a-z0-9]", "", (text or "").lower())
+    """Normalize text for matching (lowercase, keep only a-z and 0-9)."""
+    return (text or "").lower().encode("ascii", "ignore").translate(None, _NORM_DELETE).decode("ascii")
+
+
+def _safe_float(value: Any) -> float:
+    """Parse a number, treating empty or unparseable values as 0."""
+    try:
+        return float(value or 0)
+    except (ValueError, TypeError):
+        return 0
 
 
 def _is_additional_course(code: str) -> bool:
@@ -99,24 +180,74 @@ def _is_additional_course(code: str) -> bool:
     return (code or "").upper().strip() in ADDITIONAL_COURSE_CODES
 
 
+# (keyword in normalized area name, area ID), checked in order
+_AREA_KEYWORDS = (
+    ("fundamental", "fundamentals"),
+    ("datamanagement", "data-management"),
+    ("dataanalyticsmethod", "data-analytics-methods"),
+    ("dataanalyticmethod", "data-analytics-methods"),
+    ("responsible", "responsible-data-science"),
+    ("project", "projects-and-seminars"),
+    ("seminar", "projects-and-seminars"),
+    ("thesis", "master-thesis"),
+)
+
+
+@lru_cache(maxsize=256)
 def _get_area_id_from_name(name: str) -> Optional[str]:
     """Map area name to area ID."""
     n = _normalize_text(name)
-    if "fundamental" in n:
-        return "fundamentals"
-    if "datamanagement" in n:
-        return "data-management"
-    if "dataanalyticsmethod" in n or "dataanalyticmethod" in n:
-        return "data-analytics-methods"
-    if "responsible" in n:
-        return "responsible-data-science"
-    if "project" in n or "seminar" in n:
-        return "projects-and-seminars"
-    if "thesis" in n:
-        return "master-thesis"
+    for keyword, area_id in _AREA_KEYWORDS:
+        if keyword in n:
+            return area_id
     return None
 
 
+def _area_id_from_area_names(assigned: list) -> str:
+    """Resolve area ID from new-format assigned_areas: ["Data Analytics Methods", ...]."""
+    return _get_area_id_from_name(str(assigned[0])) or ""
+
+
+def _area_id_from_area_dicts(assigned: list) -> str:
+    """Resolve area ID from old-format assigned_areas: [{"area": "...", "po_version": "..."}].
+    
+    Prefers the PO 2024 entry, falls back to the first one.
+    """
+    area_id = ""
+    for aa in assigned:
+        if "PO 2024" in aa.get("po_version", ""):
+            area_id = _get_area_id_from_name(aa.get("area", "")) or ""
+            break
+    if not area_id:
+        area_id = _get_area_id_from_name(assigned[0].get("area", "")) or ""
+    return area_id
+
+
+def _area_id_from_assigned(assigned: list) -> str:
+    """Resolve area ID from assigned_areas in either format."""
+    if isinstance(assigned[0], dict):
+        return _area_id_from_area_dicts(assigned)
+    return _area_id_from_area_names(assigned)
+
+
+def _select_area_resolver(courses: List[Dict]) -> Callable[[list], str]:
+    """Pick the assigned_areas resolver for a catalog once, at load time.
+    
+    Catalogs use a single format in practice, so the per-course format check
+    is skipped unless the catalog actually mixes both.
+    """
+    formats = {
+        isinstance(c["assigned_areas"][0], dict)
+        for c in courses
+        if not c.get("area_id") and c.get("assigned_areas")
+    }
+    if formats == {True}:
+        return _area_id_from_area_dicts
+    if formats == {False}:
+        return _area_id_from_area_names
+    return _area_id_from_assigned
+
+
 def _serialize_course(course: dict, restricted_map: dict) -> dict:
     """Serialize a course for the API response."""
     # Support both field naming conventions (module_code/module_name vs code/title)
@@ -130,26 +261,10 @@ def _serialize_course(course: dict, restricted_map: dict) -> dict:
         # Try to get from assigned_areas
         assigned = course.get("assigned_areas") or []
         if assigned:
-            # assigned_areas can be list of strings or list of dicts
-            first_area = assigned[0]
-            if isinstance(first_area, dict):
-                # Old format: [{"area": "...", "po_version": "..."}]
-                for aa in assigned:
-                    if "PO 2024" in aa.get("po_version", ""):
-                        area_id = _get_area_id_from_name(aa.get("area", "")) or ""
-                        break
-                if not area_id:
-                    area_id = _get_area_id_from_name(first_area.get("area", "")) or ""
-            else:
-                # New format: ["Data Analytics Methods", ...]
-                area_id = _get_area_id_from_name(str(first_area)) or ""
+            area_id = _resolve_assigned_area(assigned)
     
     # Get area name
-    area_name = "Unassigned"
-    for area in MMDS_RULES["areas"]:
-        if area["id"] == area_id:
-            area_name = area["name"]
-            break
+    area_name = _AREA_NAME_BY_ID.get(area_id, "Unassigned")
     
     # Check restrictions
     restricted_info = restricted_map.get(code.upper(), {})
@@ -157,13 +272,12 @@ def _serialize_course(course: dict, restricted_map: dict) -> dict:
     
     # Parse ECTS
     ects_raw = course.get("ects")
-    if isinstance(ects_raw, str) and "max" in ects_raw.lower():
+    if isinstance(ects_raw, (int, float)):
+        ects = float(ects_raw)
+    elif isinstance(ects_raw, str) and "max" in ects_raw.lower():
         ects = ADDITIONAL_COURSE_MAX_ECTS if is_ac else 0
     else:
-        try:
-            ects = float(ects_raw or 0)
-        except (ValueError, TypeError):
-            ects = 0
+        ects = _safe_float(ects_raw)
     
     # Extract metrics if available
     metrics = course.get("metrics") or {}
@@ -201,8 +315,83 @@ def _serialize_course(course: dict, restricted_map: dict) -> dict:
     }
 
 
+# Catalog data, loaded once at import and refreshed only when the files change
+_DATA_MTIMES = _catalog_mtimes()
+_COURSES_RAW = _load_courses()
+_RESTRICTED_MAP = _build_restricted_map()
+_resolve_assigned_area = _select_area_resolver(_COURSES_RAW)
+
+
+def _get_serialized() -> Tuple[List[Dict], Dict[str, Dict]]:
+    """Return the serialized courses and their lookup index, rebuilding them if the data changed.
+    
+    The index maps course ID and code aliases ("ie-696", "IE 696") to the
+    serialized course. Both are shared between requests and must not be mutated.
+    """
+    global _SERIALIZED_CACHE
+    mtimes = _refresh_catalog_data()
+    if _SERIALIZED_CACHE and _SERIALIZED_CACHE[0] == mtimes:
+        return _SERIALIZED_CACHE[1], _SERIALIZED_CACHE[2]
+    
+    courses = []
+    index = {}
+    for c in _COURSES_RAW:
+        serialized = _serialize_course(c, _RESTRICTED_MAP)
+        courses.append(serialized)
+        index[serialized["id"]] = serialized
+        # Also map by code for flexibility
+        if serialized["code"]:
+            index[serialized["code"].lower().replace(" ", "-")] = serialized
+            index[serialized["code"].upper()] = serialized
+    
+    _SERIALIZED_CACHE = (mtimes, courses, index)
+    return courses, index
+
+
+def _build_catalog_body() -> bytes:
+    """Build the serialized catalog payload from the data files."""
+    serialized, _ = _get_serialized()
+    # Only include non-explicitly-restricted courses
+    courses = [c for c in serialized if not c["restricted"]]
+    
+    # Sort by title
+    courses.sort(key=lambda x: x["title"].lower())
+    
+    return (
+        b'{"courses":' + orjson.dumps(courses)
+        + b',"rules":' + _RULES_JSON
+        + b',"area_colors":' + _AREA_COLORS_JSON
+        + b"}"
+    )
+
+
+def _get_catalog_cache() -> Tuple[Dict[str, bytes], str]:
+    """Return the cached catalog bodies and ETag, rebuilding them if the data changed.
+    
+    Bodies are keyed by content coding ("identity", "br", "gzip").
+    """
+    global _CATALOG_CACHE
+    mtimes = _refresh_catalog_data()
+    if _CATALOG_CACHE and _CATALOG_CACHE[0] == mtimes:
+        return _CATALOG_CACHE[1], _CATALOG_CACHE[2]
+    
+    body = _build_catalog_body()
+    bodies = {
+        "identity": body,
+        "br": brotli.compress(body, quality=10),
+        "gzip": gzip.compress(body, compresslevel=6, mtime=0),
+    }
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    _CATALOG_CACHE = (mtimes, bodies, etag)
+    return bodies, etag
+
+
+# Build the catalog cache at import so preloaded gunicorn workers share it
+_get_catalog_cache()
+
+
 # =============================================================================
-# API ENDPOINTS (Stateless)
+# API ENDPOINTS
 # =============================================================================
 
 @app.get("/")
@@ -216,33 +405,34 @@ def get_catalog():
     """
     Get the complete course catalog and program rules.
     This is the only data the server provides - everything else is client-side.
+    
+    The catalog is read-only, so the serialized response is cached in-process
+    (pre-compressed with Brotli and gzip) and only rebuilt when one of the
+    data files changes.
     """
-    courses_raw = _load_courses()
-    restricted_data = _load_restricted()
+    bodies, etag = _get_catalog_cache()
     
-    # Build restricted map
-    restricted_map = {}
-    for item in restricted_data.get("restricted", []):
-        code = (item.get("code") or "").upper()
-        if code:
-            restricted_map[code] = item
+    encoding = "identity"
+    for candidate in ("br", "gzip"):
+        if request.accept_encodings[candidate]:
+            encoding = candidate
+            break
     
-    # Serialize courses
-    courses = []
-    for c in courses_raw:
-        serialized = _serialize_course(c, restricted_map)
-        # Only include non-explicitly-restricted courses
-        if not serialized["restricted"]:
-            courses.append(serialized)
+    # Each content coding is a distinct representation and needs its own ETag
+    if encoding != "identity":
+        etag = f"{etag}-{encoding}"
+    headers = {
+        "ETag": f'"{etag}"',
+        "Cache-Control": "public, max-age=60, must-revalidate",
+        "Vary": "Accept-Encoding",
+    }
     
-    # Sort by title
-    courses.sort(key=lambda x: x["title"].lower())
+    if request.if_none_match.contains_weak(etag):
+        return Response(status=304, headers=headers)
     
-    return jsonify({
-        "courses": courses,
-        "rules": MMDS_RULES,
-        "area_colors": AREA_COLORS,
-    })
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(bodies[encoding], mimetype="application/json", headers=headers)
 
 
 @app.post("/api/export/<format>")
@@ -264,38 +454,26 @@ def export_plan(format: str):
     if format not in {"markdown", "md", "csv", "json"}:
         return jsonify({"error": "Invalid format. Use: markdown, csv, json"}), 400
     
+    # One timestamp so the export body and the filename always agree
+    now = datetime.now()
+    now_str = now.strftime("%Y-%m-%d %H:%M")
+    fname_date = now.strftime("%Y%m%d")
+    
     payload = request.get_json(silent=True) or {}
     selections = payload.get("selections", [])
     
-    # Load catalog for course info
-    courses_raw = _load_courses()
-    restricted_data = _load_restricted()
-    restricted_map = {(item.get("code") or "").upper(): item for item in restricted_data.get("restricted", [])}
-    
-    # Build course map
-    course_map = {}
-    for c in courses_raw:
-        serialized = _serialize_course(c, restricted_map)
-        course_map[serialized["id"]] = serialized
-        # Also map by code for flexibility
-        if serialized["code"]:
-            course_map[serialized["code"].lower().replace(" ", "-")] = serialized
+    # Course lookup by ID and code, shared with the catalog endpoint
+    _, course_map = _get_serialized()
     
     # Build plan data
     plan_by_area: dict[str, list[dict]] = defaultdict(list)
+    area_totals: dict[str, float] = defaultdict(float)
     total_planned = 0.0
     total_completed = 0.0
     
     for sel in selections:
         course_id = sel.get("course_id") or sel.get("id") or ""
         course = course_map.get(course_id)
-        if not course:
-            # Try finding by code
-            for c in course_map.values():
-                if c.get("id") == course_id:
-                    course = c
-                    break
-        
         if not course:
             continue
         
@@ -313,6 +491,7 @@ def export_plan(format: str):
             "area": area_name,
         })
         
+        area_totals[area_name] += ects
         total_planned += ects
         if is_completed:
             total_completed += ects
@@ -320,7 +499,7 @@ def export_plan(format: str):
     # Calculate area progress
     area_progress_data = []
     for area in MMDS_RULES["areas"]:
-        area_ects = sum(c["ects"] for c in plan_by_area.get(area["name"], []))
+        area_ects = area_totals.get(area["name"], 0)
         area_progress_data.append({
             "name": area["name"],
             "planned": area_ects,
@@ -328,82 +507,84 @@ def export_plan(format: str):
             "fulfilled": area_ects >= area["min_ects"],
         })
     
-    now_str = datetime.now().strftime("%Y-%m-%d %H:%M")
-    
     # === MARKDOWN FORMAT ===
     if format in {"markdown", "md"}:
-        lines = [
-            "# Studienplan M.Sc. Data Science (Mannheim)",
-            "",
-            f"*Exportiert am {now_str}*",
-            "",
-            "---",
-            "",
-            "## Zusammenfassung",
-            "",
-            f"- **ECTS geplant:** {total_planned:.0f} / 120",
-            f"- **ECTS abgeschlossen:** {total_completed:.0f}",
-            f"- **Fortschritt:** {(total_planned / 120 * 100):.0f}%",
-            "",
-            "### Bereichs-Fortschritt",
-            "",
-            "| Bereich | Geplant | Erforderlich | Status |",
-            "|---------|---------|--------------|--------|",
-        ]
+        buf = StringIO()
+        w = buf.write
+        w("# Studienplan M.Sc. Data Science (Mannheim)\n"
+          "\n"
+          f"*Exportiert am {now_str}*\n"
+          "\n"
+          "---\n"
+          "\n"
+          "## Zusammenfassung\n"
+          "\n"
+          f"- **ECTS geplant:** {total_planned:.0f} / 120\n"
+          f"- **ECTS abgeschlossen:** {total_completed:.0f}\n"
+          f"- **Fortschritt:** {(total_planned / 120 * 100):.0f}%\n"
+          "\n"
+          "### Bereichs-Fortschritt\n"
+          "\n"
+          "| Bereich | Geplant | Erforderlich | Status |\n"
+          "|---------|---------|--------------|--------|\n")
         for ap in area_progress_data:
             status = "Erfüllt" if ap["fulfilled"] else "Offen"
-            lines.append(f"| {ap['name']} | {ap['planned']:.0f} ECTS | {ap['required']:.0f} ECTS | {status} |")
+            w(f"| {ap['name']} | {ap['planned']:.0f} ECTS | {ap['required']:.0f} ECTS | {status} |\n")
         
-        lines.extend(["", "---", "", "## Geplante Module", ""])
+        w("\n---\n\n## Geplante Module\n\n")
         
         for area_name in sorted(plan_by_area.keys()):
             courses = plan_by_area[area_name]
-            area_ects = sum(c["ects"] for c in courses)
-            lines.append(f"### {area_name} ({area_ects:.0f} ECTS)")
-            lines.append("")
-            lines.append("| Code | Titel | ECTS | Dozent | Status |")
-            lines.append("|------|-------|------|--------|--------|")
-            for c in sorted(courses, key=lambda x: x["code"]):
-                lines.append(f"| {c['code']} | {c['title']} | {c['ects']:.0f} | {c['professor']} | {c['status']} |")
-            lines.append("")
+            w(f"### {area_name} ({area_totals[area_name]:.0f} ECTS)\n"
+              "\n"
+              "| Code | Titel | ECTS | Dozent | Status |\n"
+              "|------|-------|------|--------|--------|\n")
+            for c in sorted(courses, key=itemgetter("code")):
+                w(f"| {c['code']} | {c['title']} | {c['ects']:.0f} | {c['professor']} | {c['status']} |\n")
+            w("\n")
         
-        lines.extend([
-            "---",
-            "",
-            "*Generiert mit dem Mannheim DS Planner*",
-        ])
+        w("---\n\n*Generiert mit dem Mannheim DS Planner*")
         
-        content = "\n".join(lines)
+        content = buf.getvalue()
         response = Response(content, mimetype="text/markdown")
-        response.headers["Content-Disposition"] = f"attachment; filename=studienplan_{datetime.now().strftime('%Y%m%d')}.md"
+        response.headers["Content-Disposition"] = f"attachment; filename=studienplan_{fname_date}.md"
         return response
     
     # === CSV FORMAT ===
     elif format == "csv":
-        output = StringIO()
-        writer = csv_module.writer(output, delimiter=";")
-        
-        writer.writerow(["Bereich", "Code", "Titel", "ECTS", "Dozent", "Status"])
-        
-        for area_name in sorted(plan_by_area.keys()):
-            for c in sorted(plan_by_area[area_name], key=lambda x: x["code"]):
-                writer.writerow([
-                    c["area"],
-                    c["code"],
-                    c["title"],
-                    f"{c['ects']:.0f}",
-                    c["professor"],
-                    c["status"],
-                ])
-        
-        writer.writerow([])
-        writer.writerow(["# Zusammenfassung"])
-        writer.writerow(["ECTS geplant", f"{total_planned:.0f}"])
-        writer.writerow(["ECTS abgeschlossen", f"{total_completed:.0f}"])
+        def generate():
+            """Stream the CSV one area at a time, reusing a single buffer."""
+            output = StringIO()
+            writer = csv_module.writer(output, delimiter=";")
+            
+            def flush() -> str:
+                chunk = output.getvalue()
+                output.seek(0)
+                output.truncate(0)
+                return chunk
+            
+            writer.writerow(["Bereich", "Code", "Titel", "ECTS", "Dozent", "Status"])
+            
+            for area_name in sorted(plan_by_area.keys()):
+                for c in sorted(plan_by_area[area_name], key=itemgetter("code")):
+                    writer.writerow([
+                        c["area"],
+                        c["code"],
+                        c["title"],
+                        f"{c['ects']:.0f}",
+                        c["professor"],
+                        c["status"],
+                    ])
+                yield flush()
+            
+            writer.writerow([])
+            writer.writerow(["# Zusammenfassung"])
+            writer.writerow(["ECTS geplant", f"{total_planned:.0f}"])
+            writer.writerow(["ECTS abgeschlossen", f"{total_completed:.0f}"])
+            yield flush()
         
-        content = output.getvalue()
-        response = Response(content, mimetype="text/csv")
-        response.headers["Content-Disposition"] = f"attachment; filename=studienplan_{datetime.now().strftime('%Y%m%d')}.csv"
+        response = Response(generate(), mimetype="text/csv")
+        response.headers["Content-Disposition"] = f"attachment; filename=studienplan_{fname_date}.csv"
         return response
     
     # === JSON FORMAT ===
@@ -421,18 +602,21 @@ def export_plan(format: str):
             "modules": [
                 c
                 for area in sorted(plan_by_area.keys())
-                for c in sorted(plan_by_area[area], key=lambda x: x["code"])
+                for c in sorted(plan_by_area[area], key=itemgetter("code"))
             ],
         }
-        response = jsonify(result)
-        response.headers["Content-Disposition"] = f"attachment; filename=studienplan_{datetime.now().strftime('%Y%m%d')}.json"
+        response = Response(orjson.dumps(result), mimetype="application/json")
+        response.headers["Content-Disposition"] = f"attachment; filename=studienplan_{fname_date}.json"
         return response
 
 
 @app.get("/api/health")
 def health():
     """Health check endpoint for container orchestration."""
-    return jsonify({"status": "healthy", "version": "1.0.0"})
+    response = jsonify({"status": "healthy", "version": "1.0.0"})
+    # Liveness must never be answered from an intermediary cache
+    response.headers["Cache-Control"] = "no-store"
+    return response
 
 
 @app.route("/sitemap.xml")
@@ -466,4 +650,5 @@ Sitemap: https://www.mmds-planner.de/sitemap.xml
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
-    app.run(host="0.0.0.0", port=port, debug=True)
+    # Development server only; production runs under gunicorn (see gunicorn_conf.py)
+    app.run(host="0.0.0.0", port=port)